@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import logging
 import sys
+import threading
+import time
 
-from azure.core.credentials import AzureKeyCredential
+from azure.core.credentials import AccessToken, AzureKeyCredential
 from azure.core.pipeline.policies import AzureKeyCredentialPolicy
 from azure.identity import DefaultAzureCredential
 
@@ -18,6 +20,12 @@ if sys.version_info >= (3, 12):
 else:
     from typing_extensions import Any
 
+DEMO_WORKSPACE_ID = "DEMO_WORKSPACE"
+DEMO_API_KEY = "DEMO_KEY"
+
+# Refresh cached tokens this many seconds before they actually expire
+TOKEN_REFRESH_MARGIN_SECONDS = 300
+
 
 class AzureLogAnalyticsAuthenticator:
     """Authenticator class for AzureLogAnalytics using DefaultAzureCredential or AzureKeyCredential for testing."""
@@ -31,22 +39,40 @@ class AzureLogAnalyticsAuthenticator:
         self._credential: DefaultAzureCredential | AzureKeyCredential | None = None
         self._authentication_policy: AzureKeyCredentialPolicy | None = None
         self._workspace_id = workspace_id
+        self._token_cache: dict[tuple[tuple[str, ...], str | None, bool], AccessToken] = {}
+        self._token_lock = threading.Lock()
+
+    @property
+    def is_demo(self) -> bool:
+        """Whether the authenticator targets the public demo workspace.
+
+        Returns:
+            True if the demo workspace is configured.
+        """
+        return self._workspace_id == DEMO_WORKSPACE_ID
 
     @property
     def credential(self) -> DefaultAzureCredential | AzureKeyCredential:
-        """Get the Azure credential instance.
+        """Get the Azure credential instance, building it on first access.
 
         Returns:
             DefaultAzureCredential or AzureKeyCredential instance for authentication.
         """
         if self._credential is None:
-            # Check if we're using the demo workspace for testing
-            if self._workspace_id == "DEMO_WORKSPACE":
-                self._credential = AzureKeyCredential("DEMO_KEY")
-            else:
-                self._credential = DefaultAzureCredential()
+            self._credential = self._build_credential()
         return self._credential
 
+    def _build_credential(self) -> DefaultAzureCredential | AzureKeyCredential:
+        """Build the Azure credential for the configured workspace.
+
+        Returns:
+            AzureKeyCredential for the demo workspace, DefaultAzureCredential otherwise.
+        """
+        # Check if we're using the demo workspace for testing
+        if self.is_demo:
+            return AzureKeyCredential(DEMO_API_KEY)
+        return DefaultAzureCredential()
+
     @property
     def authentication_policy(self) -> AzureKeyCredentialPolicy | None:
         """Get the authentication policy for the credential.
@@ -54,40 +80,55 @@ class AzureLogAnalyticsAuthenticator:
         Returns:
             AzureKeyCredentialPolicy for demo workspace, None for production.
         """
-        if self._authentication_policy is None:
-            # Check if we're using the demo workspace for testing
-            if self._workspace_id == "DEMO_WORKSPACE":
-                credential = self.credential
-                if isinstance(credential, AzureKeyCredential):
-                    self._authentication_policy = AzureKeyCredentialPolicy(
-                        name="X-Api-Key", credential=credential
-                    )
-                else:
-                    # This shouldn't happen in demo mode, but handle gracefully
-                    self._authentication_policy = None
-            else:
-                self._authentication_policy = None
+        # Only the demo workspace needs a custom policy, and it never touches
+        # DefaultAzureCredential to build one
+        if self._authentication_policy is None and self.is_demo:
+            self._authentication_policy = AzureKeyCredentialPolicy(
+                name="X-Api-Key", credential=AzureKeyCredential(DEMO_API_KEY)
+            )
         return self._authentication_policy
 
     def get_token(self, *scopes: str, **kwargs: Any) -> Any:
         """Get an access token for the specified scopes.
 
+        Tokens are cached per scope tuple, tenant and CAE mode, and reused until they
+        are within ``TOKEN_REFRESH_MARGIN_SECONDS`` of expiry. The underlying
+        credential is only built on the first token request.
+
         Args:
             *scopes: The scopes to request access for.
             **kwargs: Additional arguments passed to get_token.
 
         Returns:
             Access token for the specified scopes.
+
+        Raises:
+            NotImplementedError: If called for the demo workspace.
         """
-        # AzureKeyCredential doesn't have get_token method, so we need to handle it differently
-        if isinstance(self.credential, AzureKeyCredential):
-            # For AzureKeyCredential, we don't need to get tokens - it's used directly
-            # This method shouldn't be called for AzureKeyCredential, but if it is,
-            # we'll raise a helpful error
+        # The demo workspace authenticates with an API key via authentication_policy,
+        # so token-based authentication is never valid for it
+        if self.is_demo:
             msg = (
                 "AzureKeyCredential doesn't support token-based authentication. "
                 "It should be used directly with the LogsQueryClient."
             )
             raise NotImplementedError(msg)
-        # For DefaultAzureCredential, use the normal get_token method
-        return self.credential.get_token(*scopes, **kwargs)
+
+        # A claims challenge always requires a fresh token
+        if kwargs.get("claims"):
+            return self.credential.get_token(*scopes, **kwargs)
+
+        # For DefaultAzureCredential, reuse a cached token while it is still valid. The
+        # tenant and CAE mode change which token is issued, so they are part of the key.
+        key = (scopes, kwargs.get("tenant_id"), bool(kwargs.get("enable_cae")))
+        token = self._token_cache.get(key)
+        if token is not None and token.expires_on - time.time() > TOKEN_REFRESH_MARGIN_SECONDS:
+            return token
+
+        with self._token_lock:
+            # Another thread may have refreshed the token while we waited for the lock
+            token = self._token_cache.get(key)
+            if token is None or token.expires_on - time.time() <= TOKEN_REFRESH_MARGIN_SECONDS:
+                token = self.credential.get_token(*scopes, **kwargs)
+                self._token_cache[key] = token
+            return token
@@ -2,26 +2,124 @@
 
 from __future__ import annotations
 
+import contextlib
+import gzip
+import hashlib
+import json
 import logging
+import os
 import typing as t
-from datetime import datetime, timedelta, timezone
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
 from functools import cached_property
+from pathlib import Path
+from types import MappingProxyType
 
-from azure.core.credentials import AzureKeyCredential
 from azure.core.exceptions import HttpResponseError
 from azure.monitor.query import LogsQueryClient, LogsQueryStatus
 from singer_sdk import typing as th
 from singer_sdk.streams import Stream
 
-from tap_azure_log_analytics.auth import AzureLogAnalyticsAuthenticator
+try:
+    from dateutil.parser import parse as _parse_datetime  # type: ignore[import-untyped]
+except ImportError:
+    # Fallback to datetime.fromisoformat if dateutil is not available
+    _parse_datetime = datetime.fromisoformat
 
 if t.TYPE_CHECKING:
+    from collections.abc import Mapping
+    from concurrent.futures import Future
+
+    from azure.monitor.query import LogsQueryPartialResult, LogsQueryResult
     from singer_sdk.helpers.types import Context
 
+    RowConverter = t.Callable[[t.Sequence[t.Any]], dict[str, t.Any]]
+
 # Also configure azure http logging for broader Azure SDK verbosity control
 azure_http_logger = logging.getLogger("azure.core.pipeline.policies.http_logging_policy")
 azure_http_logger.setLevel(logging.WARNING)
 
+# Lag behind now to ensure all data has landed, and the default query window
+_END_TIME_LAG = timedelta(minutes=5)
+_DEFAULT_TIMESPAN = timedelta(days=1)
+
+# Root directory for on-disk caches
+CACHE_DIR = Path.home() / ".cache" / "tap-azure-log-analytics"
+
+# On-disk cache of query results for chunks old enough to no longer change
+RECORD_CACHE_DIR = CACHE_DIR / "records"
+RECORD_CACHE_IMMUTABLE_AFTER = timedelta(hours=24)
+
+# Number of timespan chunks queried in parallel unless configured otherwise
+DEFAULT_MAX_CONCURRENT_CHUNKS = 4
+
+# Tables wider than this convert rows with dict(zip(...)) instead of generated code
+MAX_SPECIALIZED_COLUMNS = 24
+
+# Azure Log Analytics column types (lowercase) mapped to Singer types
+_DEFAULT_COLUMN_TYPE: th.JSONTypeHelper = th.StringType()
+COLUMN_TYPE_MAPPING: Mapping[str, th.JSONTypeHelper] = MappingProxyType(
+    {
+        "string": _DEFAULT_COLUMN_TYPE,
+        "guid": th.UUIDType(),
+        "long": th.IntegerType(),
+        "int": th.IntegerType(),
+        "real": th.NumberType(),
+        "decimal": th.DecimalType(),
+        "bool": th.BooleanType(),
+        "datetime": th.DateTimeType(),
+        "timespan": _DEFAULT_COLUMN_TYPE,
+        "dynamic": _DEFAULT_COLUMN_TYPE,  # Treat dynamic types as strings
+    }
+)
+
+
+def _json_default(value: t.Any) -> str:
+    """Serialize values the json module doesn't handle natively.
+
+    Datetimes are formatted exactly as the Singer SDK formats them in RECORD
+    messages, so cached records are emitted identically to freshly queried ones.
+
+    Args:
+        value: The value to serialize.
+
+    Returns:
+        ISO 8601 string for dates and datetimes, str() of anything else.
+    """
+    if isinstance(value, datetime):
+        # Make naive datetimes UTC and always include microseconds, like the SDK
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.isoformat("T", timespec="microseconds")
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def _compile_row_converter(columns: tuple[str, ...]) -> RowConverter:
+    """Generate a function converting rows with a fixed column layout to records.
+
+    The generated function builds the record with a single dict literal
+    (``{"col0": row[0], "col1": row[1], ...}``), which is markedly faster in CPython
+    than ``dict(zip(columns, row))`` for typical column counts. Very wide tables
+    gain nothing from this and use ``dict(zip(...))`` instead.
+
+    Args:
+        columns: The table's column names.
+
+    Returns:
+        Function converting a row to a record.
+    """
+    if len(columns) > MAX_SPECIALIZED_COLUMNS:
+        return lambda row: dict(zip(columns, row, strict=False))
+
+    # Column names are embedded via repr(), so they can only ever be string literals
+    items = ", ".join(f"{name!r}: row[{index}]" for index, name in enumerate(columns))
+    namespace: dict[str, t.Any] = {}
+    exec(f"def convert_row(row):\n    return {{{items}}}\n", namespace)  # noqa: S102
+    return namespace["convert_row"]
+
 
 class AzureLogAnalyticsStream(Stream):
     """Azure Log Analytics stream class."""
@@ -34,41 +132,18 @@ class AzureLogAnalyticsStream(Stream):
             name: The stream name.
         """
         super().__init__(tap, name=name)
-        self._client: LogsQueryClient | None = None
         self._schema: dict[str, t.Any] | None = None
+        self.query_config: dict[str, t.Any] = {}
+        self._row_converters: dict[tuple[str, ...], RowConverter] = {}
 
     @cached_property
     def client(self) -> LogsQueryClient:
         """Get the Azure Log Analytics client.
 
         Returns:
-            LogsQueryClient instance.
+            LogsQueryClient instance shared across all streams of the tap.
         """
-        if self._client is None:
-            workspace_id = self.config.get("workspace_id")
-            authenticator = AzureLogAnalyticsAuthenticator(workspace_id=workspace_id)
-            credential = authenticator.credential
-
-            # Handle different credential types appropriately
-            if isinstance(credential, AzureKeyCredential):
-                # AzureKeyCredential is not a TokenCredential, so we need to use
-                # a TokenCredential for the LogsQueryClient constructor, but the
-                # actual authentication will be handled by the authentication_policy
-                from azure.identity import DefaultAzureCredential
-
-                self._client = LogsQueryClient(
-                    credential=DefaultAzureCredential(),
-                    authentication_policy=authenticator.authentication_policy,
-                    endpoint=self.config.get("endpoint", "https://api.loganalytics.io"),
-                )
-            else:
-                # DefaultAzureCredential is a TokenCredential, so we can use it directly
-                self._client = LogsQueryClient(
-                    credential=credential,
-                    authentication_policy=authenticator.authentication_policy,
-                    endpoint=self.config.get("endpoint", "https://api.loganalytics.io"),
-                )
-        return self._client
+        return self._tap.shared_client
 
     def _map_column_type(self, column_type: str) -> th.JSONTypeHelper:
         """Map Azure Log Analytics column type to Singer type.
@@ -79,20 +154,7 @@ class AzureLogAnalyticsStream(Stream):
         Returns:
             Singer type helper.
         """
-        type_mapping = {
-            "string": th.StringType(),
-            "guid": th.UUIDType(),
-            "long": th.IntegerType(),
-            "int": th.IntegerType(),
-            "real": th.NumberType(),
-            "decimal": th.DecimalType(),
-            "bool": th.BooleanType(),
-            "datetime": th.DateTimeType(),
-            "timespan": th.StringType(),
-            "dynamic": th.StringType(),  # Treat dynamic types as strings
-        }
-
-        return type_mapping.get(column_type.lower(), th.StringType())  # type: ignore[return-value]
+        return COLUMN_TYPE_MAPPING.get(column_type.lower(), _DEFAULT_COLUMN_TYPE)
 
     def _generate_schema_from_results(self, tables: list[t.Any]) -> dict[str, t.Any]:
         """Generate schema from query results.
@@ -135,7 +197,7 @@ class AzureLogAnalyticsStream(Stream):
             Tuple of (start_time, end_time).
         """
         # Get end time (default to now - 5 minutes to ensure all data has landed)
-        end_time = datetime.now(timezone.utc) - timedelta(minutes=5)
+        end_time = datetime.now(timezone.utc) - _END_TIME_LAG
 
         # Get start time from replication key state, start_date, or timespan_days
         if self.replication_key:
@@ -147,22 +209,16 @@ class AzureLogAnalyticsStream(Stream):
             if start_time is not None:
                 # Convert string to datetime if needed
                 if isinstance(start_time, str):
-                    try:
-                        from dateutil.parser import parse  # type: ignore[import-untyped]
-
-                        start_time = parse(start_time)
-                    except ImportError:
-                        # Fallback to datetime.fromisoformat if dateutil is not available
-                        start_time = datetime.fromisoformat(start_time)
+                    start_time = _parse_datetime(start_time)
             else:
                 # Fall back to timespan_days if no start_date specified
-                timespan_days = getattr(self, "query_config", {}).get("timespan_days")
+                timespan_days = self.query_config.get("timespan_days")
                 if timespan_days:
                     # Use timespan_days to calculate start time
                     start_time = end_time - timedelta(days=timespan_days)
                 else:
                     # Default to 1 day ago if no start time specified
-                    start_time = end_time - timedelta(days=1)
+                    start_time = end_time - _DEFAULT_TIMESPAN
 
         # Ensure timezone awareness
         if start_time is not None and start_time.tzinfo is None:
@@ -170,7 +226,7 @@ class AzureLogAnalyticsStream(Stream):
 
         # Ensure we have a valid start_time
         if start_time is None:
-            start_time = end_time - timedelta(days=1)
+            start_time = end_time - _DEFAULT_TIMESPAN
 
         return start_time, end_time
 
@@ -197,14 +253,43 @@ class AzureLogAnalyticsStream(Stream):
 
         chunks = []
         current_start = start_time
+        chunk_span = timedelta(days=chunk_days)
 
         while current_start < end_time:
-            current_end = min(current_start + timedelta(days=chunk_days), end_time)
+            current_end = min(current_start + chunk_span, end_time)
             chunks.append((current_start, current_end))
             current_start = current_end
 
         return chunks
 
+    def _records_from_tables(self, tables: list[t.Any]) -> t.Iterator[dict[str, t.Any]]:
+        """Convert query result tables to records.
+
+        Args:
+            tables: List of tables from query results.
+
+        Yields:
+            One record per row, keyed by column name.
+        """
+        for table in tables:
+            yield from map(self._row_converter(table.columns), table.rows)
+
+    def _row_converter(self, columns: t.Sequence[str]) -> RowConverter:
+        """Get the row converter specialized for a column layout.
+
+        Args:
+            columns: The table's column names.
+
+        Returns:
+            Function converting a row to a record, cached per column layout.
+        """
+        key = tuple(columns)
+        converter = self._row_converters.get(key)
+        if converter is None:
+            converter = _compile_row_converter(key)
+            self._row_converters[key] = converter
+        return converter
+
     def get_records(self, context: Context | None) -> t.Iterable[dict[str, t.Any]]:
         """Get records from Azure Log Analytics.
 
@@ -215,7 +300,7 @@ class AzureLogAnalyticsStream(Stream):
             Records from the query.
         """
         # Get query configuration
-        query = getattr(self, "query_config", {}).get("query", "")
+        query = self.query_config.get("query", "")
         if not query:
             self.logger.error("No query configured for stream")
             return
@@ -224,39 +309,231 @@ class AzureLogAnalyticsStream(Stream):
         start_time, end_time = self._calculate_timespan(context)
 
         # Get chunk size from config
-        chunk_days = getattr(self, "query_config", {}).get("chunk_size_days", 1)
+        chunk_days = self.query_config.get("chunk_size_days", 1)
 
         # Split into chunks if needed
         chunks = self._chunk_timespan(start_time, end_time, chunk_days)
 
-        for chunk_start, chunk_end in chunks:
-            self.logger.info(f"Querying {self.name} from {chunk_start} to {chunk_end}")
+        if not chunks:
+            return
+
+        # Chunks old enough to be immutable may be served from the on-disk record cache
+        cache_paths = [self._record_cache_path(query, *chunk) for chunk in chunks]
+
+        # Query up to max_concurrent_chunks upcoming chunks on background threads while
+        # the current chunk's rows are being yielded. Chunks are still yielded in order.
+        max_concurrent_chunks = max(
+            1, self.config.get("max_concurrent_chunks") or DEFAULT_MAX_CONCURRENT_CHUNKS
+        )
+        # Resolve the shared client here: the cached properties behind it aren't locked,
+        # so first access from the worker threads could build several clients
+        client = self.client
+        with ThreadPoolExecutor(max_workers=max_concurrent_chunks) as executor:
+
+            def submit(index: int) -> Future[LogsQueryResult | LogsQueryPartialResult] | None:
+                if index >= len(chunks):
+                    return None
+                cache_path = cache_paths[index]
+                if cache_path is not None and cache_path.exists():
+                    return None
+                return executor.submit(self._query_chunk, client, query, *chunks[index])
+
+            # One entry per upcoming chunk; None marks a chunk to read from the cache
+            pending = deque(submit(index) for index in range(max_concurrent_chunks))
 
             try:
-                # Execute query
-                response = self.client.query_workspace(
-                    workspace_id=self.config["workspace_id"],
-                    query=query,
-                    timespan=(chunk_start, chunk_end),
+                for index, (chunk_start, chunk_end) in enumerate(chunks):
+                    current = pending.popleft()
+                    pending.append(submit(index + max_concurrent_chunks))
+                    yield from self._chunk_records(
+                        current, query, chunk_start, chunk_end, cache_paths[index]
+                    )
+            finally:
+                # Don't start prefetched queries if the consumer stopped early
+                for future in pending:
+                    if future is not None:
+                        future.cancel()
+
+    def _chunk_records(
+        self,
+        future: Future[LogsQueryResult | LogsQueryPartialResult] | None,
+        query: str,
+        chunk_start: datetime,
+        chunk_end: datetime,
+        cache_path: Path | None,
+    ) -> t.Iterator[dict[str, t.Any]]:
+        """Get a chunk's records from its pending query or the record cache.
+
+        A chunk whose cache entry can't be read is queried on the calling thread.
+
+        The chunk's future keeps its response alive. ``get_records`` holds the future
+        only until it moves on to the next chunk, which happens before that chunk's
+        result is awaited, so a yielded chunk's rows can be freed while later chunks
+        are still being queried.
+
+        Args:
+            future: The chunk's pending query, or None if the chunk is cached.
+            query: The KQL query.
+            chunk_start: Start of the chunk.
+            chunk_end: End of the chunk.
+            cache_path: Record cache path for the chunk, or None if it can't be cached.
+
+        Yields:
+            Records from the chunk.
+        """
+        if future is None:
+            records = self._read_cached_records(cache_path)
+            if records is not None:
+                self.logger.info(f"Reading {self.name} from cache for {chunk_start} to {chunk_end}")
+                yield from records
+                return
+
+        try:
+            if future is None:
+                response = self._query_chunk(self.client, query, chunk_start, chunk_end)
+            else:
+                response = future.result()
+        except HttpResponseError as e:
+            self.logger.exception(f"Error querying {self.name}: {e}")
+            raise
+
+        yield from self._records_from_response(response, chunk_start, chunk_end, cache_path)
+
+    def _records_from_response(
+        self,
+        response: LogsQueryResult | LogsQueryPartialResult,
+        chunk_start: datetime,
+        chunk_end: datetime,
+        cache_path: Path | None,
+    ) -> t.Iterator[dict[str, t.Any]]:
+        """Convert a chunk's query response to records.
+
+        Args:
+            response: The chunk's query response.
+            chunk_start: Start of the chunk.
+            chunk_end: End of the chunk.
+            cache_path: Record cache path for the chunk, or None if it can't be cached.
+
+        Yields:
+            Records from the response.
+        """
+        if response.status == LogsQueryStatus.SUCCESS:
+            records = self._records_from_tables(response.tables)
+            if cache_path is not None:
+                records = self._write_cached_records(cache_path, records)
+            yield from records
+
+        elif response.status == LogsQueryStatus.PARTIAL:
+            # Partial results are never cached so the chunk is retried on the next run
+            self.logger.warning(
+                f"Partial results for {self.name} in chunk {chunk_start} to {chunk_end}"
+            )
+            yield from self._records_from_tables(response.partial_data)
+
+    def _record_cache_path(
+        self, query: str, chunk_start: datetime, chunk_end: datetime
+    ) -> Path | None:
+        """Get the on-disk record cache path for a chunk.
+
+        Args:
+            query: The KQL query.
+            chunk_start: Start of the chunk.
+            chunk_end: End of the chunk.
+
+        Returns:
+            Path of the cached records file, or None if the chunk can't be cached.
+        """
+        if not self.config.get("record_cache_enabled"):
+            return None
+
+        # Only chunks entirely outside the ingestion window are safe to reuse
+        if chunk_end >= datetime.now(timezone.utc) - RECORD_CACHE_IMMUTABLE_AFTER:
+            return None
+
+        key = hashlib.sha256(
+            "|".join(
+                (
+                    self.config["workspace_id"],
+                    query,
+                    chunk_start.isoformat(),
+                    chunk_end.isoformat(),
                 )
+            ).encode()
+        ).hexdigest()
+        return RECORD_CACHE_DIR / f"{key}.ndjson.gz"
 
-                # Handle response
-                if response.status == LogsQueryStatus.SUCCESS:
-                    for table in response.tables:
-                        for row in table.rows:
-                            # Convert row to dict using column names
-                            record = dict(zip(table.columns, row, strict=False))
-                            yield record
-
-                elif response.status == LogsQueryStatus.PARTIAL:
-                    self.logger.warning(
-                        f"Partial results for {self.name} in chunk {chunk_start} to {chunk_end}"
-                    )
-                    for table in response.partial_data:
-                        for row in table.rows:
-                            record = dict(zip(table.columns, row, strict=False))
-                            yield record
-
-            except HttpResponseError as e:
-                self.logger.exception(f"Error querying {self.name}: {e}")
-                raise
+    def _read_cached_records(self, cache_path: Path) -> list[dict[str, t.Any]] | None:
+        """Read a chunk's records from the on-disk cache.
+
+        The whole entry is read before any record is returned, so an unreadable entry
+        can be replaced by a live query without emitting duplicate records. Unreadable
+        entries are deleted so the next run caches the chunk again.
+
+        Args:
+            cache_path: Path of the cached records file.
+
+        Returns:
+            Cached records, or None if the entry is missing or unreadable.
+        """
+        try:
+            with gzip.open(cache_path, "rt", encoding="utf-8") as f:
+                return list(map(json.loads, f))
+        except (OSError, EOFError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable record cache for {self.name}: {e}")
+            with contextlib.suppress(OSError):
+                cache_path.unlink(missing_ok=True)
+            return None
+
+    def _write_cached_records(
+        self, cache_path: Path, records: t.Iterable[dict[str, t.Any]]
+    ) -> t.Iterator[dict[str, t.Any]]:
+        """Write a chunk's records to the on-disk cache as they are yielded.
+
+        The cache file is only moved into place once every record has been written,
+        so an interrupted sync never leaves a truncated chunk behind. Each record is
+        yielded before it is written, so a failed write stops caching without losing
+        any records.
+
+        Args:
+            cache_path: Path of the cached records file.
+            records: The chunk's records.
+
+        Yields:
+            The same records, unchanged.
+        """
+        records = iter(records)
+        partial_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            # Cached rows are raw workspace data, so keep them private to this user
+            cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            with gzip.open(partial_path, "wt", encoding="utf-8") as f:
+                for record in records:
+                    yield record
+                    f.write(json.dumps(record, default=_json_default) + "\n")
+            partial_path.replace(cache_path)
+        except OSError as e:
+            self.logger.warning(f"Unable to cache records for {self.name}: {e}")
+            yield from records
+        finally:
+            partial_path.unlink(missing_ok=True)
+
+    def _query_chunk(
+        self, client: LogsQueryClient, query: str, chunk_start: datetime, chunk_end: datetime
+    ) -> LogsQueryResult | LogsQueryPartialResult:
+        """Execute the query for a single timespan chunk.
+
+        Args:
+            client: The Log Analytics client to query with.
+            query: The KQL query.
+            chunk_start: Start of the chunk.
+            chunk_end: End of the chunk.
+
+        Returns:
+            The query response.
+        """
+        self.logger.info(f"Querying {self.name} from {chunk_start} to {chunk_end}")
+        return client.query_workspace(
+            workspace_id=self.config["workspace_id"],
+            query=query,
+            timespan=(chunk_start, chunk_end),
+        )
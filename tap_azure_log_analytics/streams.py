@@ -2,12 +2,38 @@
 
 from __future__ import annotations
 
+import copy
+import hashlib
+import json
+import time
 import typing as t
+from datetime import datetime, timedelta, timezone
 
 from azure.monitor.query import LogsQueryStatus
 from singer_sdk import typing as th  # JSON Schema typing helpers
 
-from tap_azure_log_analytics.client import AzureLogAnalyticsStream
+from tap_azure_log_analytics.client import CACHE_DIR, AzureLogAnalyticsStream
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+    from azure.monitor.query import LogsQueryPartialResult, LogsQueryResult
+
+# Window of recent data sampled to infer a stream's schema
+SCHEMA_SAMPLE_TIMESPAN = timedelta(hours=1)
+
+# On-disk cache of generated schemas, used when schema_cache_ttl_days is set
+SCHEMA_CACHE_DIR = CACHE_DIR
+
+
+def schema_sample_timespan() -> tuple[datetime, datetime]:
+    """Get the small sample window used to infer schemas.
+
+    Returns:
+        Tuple of (start_time, end_time) covering the last hour.
+    """
+    end_time = datetime.now(timezone.utc)
+    return end_time - SCHEMA_SAMPLE_TIMESPAN, end_time
 
 
 class LogAnalyticsQueryStream(AzureLogAnalyticsStream):
@@ -20,10 +46,10 @@ class LogAnalyticsQueryStream(AzureLogAnalyticsStream):
             tap: The tap instance.
             query_config: Configuration dictionary containing query details.
         """
-        self.query_config = query_config
-
         super().__init__(tap, name=query_config["name"])
 
+        self.query_config = query_config
+
         self.primary_keys = query_config.get("primary_keys", [])
         self.replication_key = query_config.get("replication_key")
 
@@ -35,41 +61,149 @@ class LogAnalyticsQueryStream(AzureLogAnalyticsStream):
             JSON schema for the stream.
         """
         if self._schema is None:
-            self._schema = self._generate_schema()
+            self._schema = self.generate_schema() or th.PropertiesList().to_dict()
         return self._schema
 
-    def _generate_schema(self) -> dict[str, t.Any]:
-        """Generate schema from query results.
+    def _schema_cache_path(self, query: str) -> Path:
+        """Get the on-disk cache path for a query's schema.
+
+        Args:
+            query: The KQL query.
 
         Returns:
-            JSON schema for the stream.
+            Path of the cached schema file.
+        """
+        key = hashlib.sha256(f"{self.config['workspace_id']}|{query}".encode()).hexdigest()
+        return SCHEMA_CACHE_DIR / f"{key}.json"
+
+    def _read_cached_schema(self, query: str) -> dict[str, t.Any] | None:
+        """Read a previously generated schema from disk if it is still fresh.
+
+        Args:
+            query: The KQL query.
+
+        Returns:
+            The cached schema, or None if caching is disabled or no fresh entry exists.
         """
-        # Execute a sample query to get schema
+        ttl_days = self.config.get("schema_cache_ttl_days")
+        if not ttl_days:
+            return None
+
+        cache_path = self._schema_cache_path(query)
+        try:
+            if time.time() - cache_path.stat().st_mtime > ttl_days * 86400:
+                return None
+            with cache_path.open(encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_cached_schema(self, query: str, schema: dict[str, t.Any]) -> None:
+        """Persist a generated schema to disk.
+
+        Args:
+            query: The KQL query.
+            schema: The generated schema.
+        """
+        # Don't cache empty schemas produced by failed or empty sample queries
+        if not self.config.get("schema_cache_ttl_days") or not schema.get("properties"):
+            return
+
+        cache_path = self._schema_cache_path(query)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with cache_path.open("w", encoding="utf-8") as f:
+                json.dump(schema, f)
+        except OSError as e:
+            self.logger.warning(f"Unable to cache schema for {self.name}: {e}")
+
+    def generate_schema(
+        self,
+        sample_response: LogsQueryResult | LogsQueryPartialResult | None = None,
+        *,
+        allow_sample_query: bool = True,
+    ) -> dict[str, t.Any] | None:
+        """Generate schema from query results, reusing previously generated schemas.
+
+        An explicit schema in the query config is used as-is. Otherwise schemas are
+        reused from earlier streams of this tap with the same query, then from the
+        on-disk cache when enabled. Failing that, the schema is inferred from
+        ``sample_response`` if given, or else from a new sample query. A schema
+        inferred from ``sample_response`` also becomes the stream's schema, so an
+        empty result isn't queried again when the schema is read.
+
+        Args:
+            sample_response: Response of a sample query already run for this stream.
+            allow_sample_query: Whether a sample query may be run if needed.
+
+        Returns:
+            JSON schema for the stream, or None if it needs a sample query that wasn't
+            allowed or ``sample_response`` is a failed query.
+        """
+        explicit_schema = self.query_config.get("schema")
+        if explicit_schema:
+            return copy.deepcopy(explicit_schema)
+
         query = self.query_config.get("query", "")
         if not query:
             return th.PropertiesList().to_dict()
 
-        try:
-            # Get a small sample to determine schema
-            from datetime import datetime, timedelta, timezone
+        run_cache = self._tap.schema_cache
+        if query in run_cache:
+            return copy.deepcopy(run_cache[query])
+
+        schema = self._read_cached_schema(query)
+        if schema is None:
+            if sample_response is not None:
+                schema = self._schema_from_response(sample_response)
+                if schema is not None:
+                    self._schema = schema
+            elif allow_sample_query:
+                schema = self._query_schema(query)
+            if schema is None:
+                return None
+            self._write_cached_schema(query, schema)
+
+        if schema.get("properties"):
+            run_cache[query] = copy.deepcopy(schema)
+        return schema
+
+    def _schema_from_response(
+        self, response: LogsQueryResult | LogsQueryPartialResult
+    ) -> dict[str, t.Any] | None:
+        """Generate schema from a sample query response.
 
-            end_time = datetime.now(timezone.utc)
-            start_time = end_time - timedelta(hours=1)  # Small sample
+        Args:
+            response: The sample query response.
 
+        Returns:
+            JSON schema for the stream, or None if the query failed.
+        """
+        if response.status == LogsQueryStatus.SUCCESS:
+            return self._generate_schema_from_results(response.tables)
+        if response.status == LogsQueryStatus.PARTIAL:
+            return self._generate_schema_from_results(response.partial_data)
+        self.logger.warning(f"Failed to get schema for {self.name}: {response.status}")
+        return None
+
+    def _query_schema(self, query: str) -> dict[str, t.Any]:
+        """Generate schema by running the query over a small sample window.
+
+        Args:
+            query: The KQL query.
+
+        Returns:
+            JSON schema for the stream.
+        """
+        try:
             response = self.client.query_workspace(
                 workspace_id=self.config["workspace_id"],
                 query=query,
-                timespan=(start_time, end_time),
+                timespan=schema_sample_timespan(),
             )
-
-            if response.status in [LogsQueryStatus.SUCCESS, LogsQueryStatus.PARTIAL]:
-                tables = (
-                    response.tables
-                    if response.status == LogsQueryStatus.SUCCESS
-                    else response.partial_data
-                )
-                return self._generate_schema_from_results(tables)
-            self.logger.warning(f"Failed to get schema for {self.name}: {response.status}")
+            schema = self._schema_from_response(response)
+            if schema is not None:
+                return schema
             return th.PropertiesList().to_dict()
 
         except Exception as e:
@@ -3,23 +3,38 @@
 from __future__ import annotations
 
 import sys
+import typing as t
+from functools import cached_property
 
+from azure.core.exceptions import AzureError
+from azure.monitor.query import LogsBatchQuery, LogsQueryClient
 from singer_sdk import Tap
 from singer_sdk import typing as th  # JSON schema typing helpers
 
 # TODO: Import your custom stream types here:
 from tap_azure_log_analytics import streams
+from tap_azure_log_analytics.auth import AzureLogAnalyticsAuthenticator
+
+try:
+    # Faster msgspec-based message serialization when the msgspec extra is installed
+    from singer_sdk.contrib.msgspec import MsgSpecWriter as SingerWriter
+except ImportError:
+    from singer_sdk.io_base import SingerWriter
 
 if sys.version_info >= (3, 12):
     from typing import override
 else:
     from typing_extensions import override
 
+# Maximum number of queries Log Analytics accepts in a single batch request
+MAX_BATCH_QUERIES = 100
+
 
 class TapAzureLogAnalytics(Tap):
     """AzureLogAnalytics tap class."""
 
     name = "tap-azure-log-analytics"
+    message_writer_class = SingerWriter
 
     config_jsonschema = th.PropertiesList(
         th.Property(
@@ -41,6 +56,35 @@ class TapAzureLogAnalytics(Tap):
             default="https://api.loganalytics.io",
             description="Azure cloud endpoint (e.g., https://api.loganalytics.io for public cloud)",
         ),
+        th.Property(
+            "schema_cache_ttl_days",
+            th.IntegerType(nullable=True),
+            title="Schema Cache TTL (Days)",
+            description=(
+                "Number of days to reuse generated stream schemas cached on disk. "
+                "Schema caching is disabled when unset."
+            ),
+        ),
+        th.Property(
+            "max_concurrent_chunks",
+            th.IntegerType(nullable=True),
+            title="Max Concurrent Chunks",
+            default=4,
+            description=(
+                "Maximum number of timespan chunks of a stream queried in parallel. Each "
+                "in-flight chunk's results are held in memory until it is emitted."
+            ),
+        ),
+        th.Property(
+            "record_cache_enabled",
+            th.BooleanType(nullable=True),
+            title="Record Cache Enabled",
+            default=False,
+            description=(
+                "Cache query results on disk for chunks that ended more than 24 hours ago "
+                "and reuse them when the same chunk is queried again."
+            ),
+        ),
         th.Property(
             "queries",
             th.ArrayType(
@@ -51,6 +95,12 @@ class TapAzureLogAnalytics(Tap):
                     th.Property("replication_key", th.StringType, nullable=True),
                     th.Property("timespan_days", th.IntegerType, nullable=True),
                     th.Property("chunk_size_days", th.IntegerType, nullable=True),
+                    th.Property(
+                        "schema",
+                        th.ObjectType(additional_properties=True),
+                        nullable=True,
+                        description="Explicit JSON schema for the stream, skipping discovery",
+                    ),
                 ),
                 nullable=False,
             ),
@@ -60,6 +110,48 @@ class TapAzureLogAnalytics(Tap):
         ),
     ).to_dict()
 
+    @cached_property
+    def authenticator(self) -> AzureLogAnalyticsAuthenticator:
+        """Get the authenticator shared by all streams.
+
+        Returns:
+            AzureLogAnalyticsAuthenticator for the configured workspace.
+        """
+        return AzureLogAnalyticsAuthenticator(workspace_id=self.config.get("workspace_id"))
+
+    @cached_property
+    def shared_client(self) -> LogsQueryClient:
+        """Get the Azure Log Analytics client shared by all streams.
+
+        A single credential (and therefore a single token cache) is reused across
+        every configured query instead of re-probing the credential chain per stream.
+
+        Returns:
+            LogsQueryClient instance.
+        """
+        authenticator = self.authenticator
+
+        # The authenticator acts as the TokenCredential so the underlying credential
+        # is only built when a token is first requested. For the demo workspace the
+        # authentication_policy handles auth and get_token is never called.
+        return LogsQueryClient(
+            credential=authenticator,  # type: ignore[arg-type]
+            authentication_policy=authenticator.authentication_policy,
+            endpoint=self.config.get("endpoint", "https://api.loganalytics.io"),
+        )
+
+    @cached_property
+    def schema_cache(self) -> dict[str, dict[str, t.Any]]:
+        """Get the schemas generated during this run, keyed by query.
+
+        Streams sharing a query reuse the schema instead of re-running the sample query.
+        The cache lives only as long as the tap instance.
+
+        Returns:
+            Mapping of KQL query to generated JSON schema.
+        """
+        return {}
+
     @override
     def discover_streams(self) -> list[streams.LogAnalyticsQueryStream]:
         """Return a list of discovered streams.
@@ -79,8 +171,63 @@ class TapAzureLogAnalytics(Tap):
             stream = streams.LogAnalyticsQueryStream(self, query_config)
             streams_list.append(stream)
 
+        # Infer schemas for all streams with as few sample-query round trips as
+        # possible. Syncs with an input catalog usually select only some streams, so
+        # leave those to query schemas on first use.
+        if self.input_catalog is None:
+            self._prefetch_schemas(streams_list)
+
         return streams_list
 
+    def _prefetch_schemas(self, query_streams: list[streams.LogAnalyticsQueryStream]) -> None:
+        """Generate schemas for many streams with batched sample queries.
+
+        Sample queries for streams without an explicit or cached schema are sent
+        together via ``query_batch`` (up to ``MAX_BATCH_QUERIES`` per request), one per
+        distinct query, and each stream keeps the schema inferred from its response.
+        Streams whose batched query fails fall back to an individual sample query when
+        their schema is read.
+
+        Args:
+            query_streams: The streams to generate schemas for.
+        """
+        pending: dict[str, list[streams.LogAnalyticsQueryStream]] = {}
+        for stream in query_streams:
+            if stream.generate_schema(allow_sample_query=False) is None:
+                pending.setdefault(stream.query_config["query"], []).append(stream)
+
+        # A single query gains nothing from batching
+        if len(pending) < 2:  # noqa: PLR2004
+            return
+
+        timespan = streams.schema_sample_timespan()
+        queries = list(pending)
+
+        for offset in range(0, len(queries), MAX_BATCH_QUERIES):
+            batch = queries[offset : offset + MAX_BATCH_QUERIES]
+            try:
+                responses = self.shared_client.query_batch(
+                    [
+                        LogsBatchQuery(
+                            workspace_id=self.config["workspace_id"],
+                            query=query,
+                            timespan=timespan,
+                        )
+                        for query in batch
+                    ]
+                )
+            except AzureError as e:
+                # Leave these streams to generate their schemas individually
+                batch_streams = ", ".join(
+                    stream.name for query in batch for stream in pending[query]
+                )
+                self.logger.warning(f"Batched schema query failed for {batch_streams}: {e}")
+                continue
+
+            for query, response in zip(batch, responses, strict=False):
+                for stream in pending[query]:
+                    stream.generate_schema(response)
+
 
 if __name__ == "__main__":
     TapAzureLogAnalytics.cli()
@@ -0,0 +1,55 @@
+"""Shared fixtures for tap-azure-log-analytics tests."""
+
+from __future__ import annotations
+
+import typing as t
+from unittest.mock import Mock
+
+import pytest
+
+from tap_azure_log_analytics.streams import LogAnalyticsQueryStream
+
+StreamFactory = t.Callable[..., LogAnalyticsQueryStream]
+
+QUERY_CONFIG: dict[str, t.Any] = {
+    "name": "test_stream",
+    "query": "test query",
+    "primary_keys": ["id"],
+    "replication_key": None,
+    "chunk_size_days": 1,
+}
+
+
+def _make_tap(config: dict[str, t.Any] | None = None) -> Mock:
+    mock_tap = Mock()
+    mock_tap.config = {"workspace_id": "test-workspace", **(config or {})}
+    mock_tap.schema_cache = {}
+    return mock_tap
+
+
+@pytest.fixture
+def mock_tap() -> Mock:
+    """Mock tap for a test workspace with an empty schema cache."""
+    return _make_tap()
+
+
+@pytest.fixture
+def make_stream() -> StreamFactory:
+    """Factory for query streams against mock taps.
+
+    ``make_stream(config=None, query_config=None, *, tap=None)`` merges ``config``
+    and ``query_config`` over the defaults. Each stream gets a new mock tap unless
+    ``tap`` is given, in which case ``config`` is ignored.
+    """
+
+    def make_stream(
+        config: dict[str, t.Any] | None = None,
+        query_config: dict[str, t.Any] | None = None,
+        *,
+        tap: Mock | None = None,
+    ) -> LogAnalyticsQueryStream:
+        return LogAnalyticsQueryStream(
+            tap or _make_tap(config), {**QUERY_CONFIG, **(query_config or {})}
+        )
+
+    return make_stream
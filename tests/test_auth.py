@@ -0,0 +1,87 @@
+"""Tests for the Azure Log Analytics authenticator."""
+
+import time
+from unittest.mock import Mock
+
+from azure.core.credentials import AccessToken
+
+from tap_azure_log_analytics.auth import AzureLogAnalyticsAuthenticator
+
+SCOPE = "https://api.loganalytics.io/.default"
+
+
+class TestTokenCaching:
+    """Test expiry-aware caching of access tokens."""
+
+    def test_get_token_reuses_valid_token(self) -> None:
+        """Test that a token far from expiry is served from the cache."""
+        authenticator = AzureLogAnalyticsAuthenticator(workspace_id="test-workspace")
+        credential = Mock()
+        credential.get_token.return_value = AccessToken("token", int(time.time()) + 3600)
+        authenticator._credential = credential
+
+        first = authenticator.get_token(SCOPE)
+        second = authenticator.get_token(SCOPE)
+
+        assert first is second
+        credential.get_token.assert_called_once_with(SCOPE)
+
+    def test_get_token_refreshes_expiring_token(self) -> None:
+        """Test that a token close to expiry is refreshed."""
+        authenticator = AzureLogAnalyticsAuthenticator(workspace_id="test-workspace")
+        credential = Mock()
+        credential.get_token.side_effect = [
+            AccessToken("old", int(time.time()) + 60),
+            AccessToken("new", int(time.time()) + 3600),
+        ]
+        authenticator._credential = credential
+
+        authenticator.get_token(SCOPE)
+        token = authenticator.get_token(SCOPE)
+
+        assert token.token == "new"
+        assert credential.get_token.call_count == 2
+
+    def test_get_token_caches_per_scope(self) -> None:
+        """Test that different scopes are cached independently."""
+        authenticator = AzureLogAnalyticsAuthenticator(workspace_id="test-workspace")
+        credential = Mock()
+        credential.get_token.return_value = AccessToken("token", int(time.time()) + 3600)
+        authenticator._credential = credential
+
+        authenticator.get_token(SCOPE)
+        authenticator.get_token("https://management.azure.com/.default")
+
+        assert credential.get_token.call_count == 2
+
+    def test_get_token_caches_per_tenant_and_cae_mode(self) -> None:
+        """Test that tokens for other tenants or CAE modes are not served from the cache."""
+        authenticator = AzureLogAnalyticsAuthenticator(workspace_id="test-workspace")
+        credential = Mock()
+        credential.get_token.return_value = AccessToken("token", int(time.time()) + 3600)
+        authenticator._credential = credential
+
+        authenticator.get_token(SCOPE)
+        authenticator.get_token(SCOPE, tenant_id="other-tenant")
+        authenticator.get_token(SCOPE, enable_cae=True)
+        authenticator.get_token(SCOPE, tenant_id="other-tenant")
+
+        assert credential.get_token.call_count == 3
+
+
+class TestLazyCredential:
+    """Test that credentials are only built when needed."""
+
+    def test_demo_policy_does_not_build_credential(self) -> None:
+        """Test that the demo authentication policy never builds a credential."""
+        authenticator = AzureLogAnalyticsAuthenticator(workspace_id="DEMO_WORKSPACE")
+
+        assert authenticator.authentication_policy is not None
+        assert authenticator._credential is None
+
+    def test_production_credential_not_built_until_token_requested(self) -> None:
+        """Test that constructing the authenticator does not build a credential."""
+        authenticator = AzureLogAnalyticsAuthenticator(workspace_id="test-workspace")
+
+        assert authenticator.authentication_policy is None
+        assert authenticator._credential is None
@@ -0,0 +1,179 @@
+"""Tests for the on-disk record cache in Azure Log Analytics streams."""
+
+from __future__ import annotations
+
+import errno
+import gzip
+import stat
+import typing as t
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+from azure.monitor.query import LogsQueryStatus
+from singer_sdk import typing as th
+from singer_sdk.helpers._typing import TypeConformanceLevel, conform_record_data_types
+
+from tap_azure_log_analytics import client
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+    from tap_azure_log_analytics.streams import LogAnalyticsQueryStream
+    from tests.conftest import StreamFactory
+
+MakeCachedStream = t.Callable[[tuple[datetime, datetime]], "LogAnalyticsQueryStream"]
+
+JAN1, JAN2, JAN3 = (datetime(2024, 1, day, tzinfo=timezone.utc) for day in (1, 2, 3))
+
+
+def query_workspace(
+    workspace_id: str,  # noqa: ARG001
+    query: str,  # noqa: ARG001
+    timespan: tuple[datetime, datetime],
+) -> Mock:
+    """Return one row holding the chunk's start time."""
+    table = Mock(columns=["id", "day"], rows=[[1, timespan[0]]])
+    return Mock(status=LogsQueryStatus.SUCCESS, tables=[table])
+
+
+@pytest.fixture
+def record_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the on-disk record cache at a temporary directory."""
+    monkeypatch.setattr(client, "RECORD_CACHE_DIR", tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def make_cached_stream(
+    make_stream: StreamFactory, monkeypatch: pytest.MonkeyPatch
+) -> MakeCachedStream:
+    """Factory for streams with record caching enabled and a mocked client."""
+
+    def make_cached_stream(timespan: tuple[datetime, datetime]) -> LogAnalyticsQueryStream:
+        stream = make_stream({"record_cache_enabled": True})
+        monkeypatch.setattr(
+            stream, "client", Mock(query_workspace=Mock(side_effect=query_workspace))
+        )
+        monkeypatch.setattr(stream, "_calculate_timespan", Mock(return_value=timespan))
+        return stream
+
+    return make_cached_stream
+
+
+class TestRecordCache:
+    """Test caching of immutable chunk results."""
+
+    def test_old_chunks_served_from_cache(
+        self, record_cache_dir: Path, make_cached_stream: MakeCachedStream
+    ) -> None:
+        """Test that chunks outside the ingestion window are cached and reused."""
+        timespan = (JAN1, JAN3)
+
+        first = make_cached_stream(timespan)
+        first_records = list(first.get_records(None))
+        assert first.client.query_workspace.call_count == 2
+        assert len(list(record_cache_dir.iterdir())) == 2
+
+        second = make_cached_stream(timespan)
+        second_records = list(second.get_records(None))
+        second.client.query_workspace.assert_not_called()
+        assert second_records == [
+            {"id": record["id"], "day": record["day"].isoformat(timespec="microseconds")}
+            for record in first_records
+        ]
+
+    @pytest.mark.usefixtures("record_cache_dir")
+    def test_cached_records_emitted_like_live_records(
+        self, make_cached_stream: MakeCachedStream
+    ) -> None:
+        """Test that a cache hit produces the same conformed records as a live query."""
+        timespan = (JAN1, JAN3)
+        schema = th.PropertiesList(
+            th.Property("id", th.IntegerType()),
+            th.Property("day", th.DateTimeType()),
+        ).to_dict()
+
+        def conform(records: list[dict[str, t.Any]]) -> list[dict[str, t.Any]]:
+            return [
+                conform_record_data_types(
+                    "test_stream", record, schema, TypeConformanceLevel.ROOT_ONLY, Mock()
+                )
+                for record in records
+            ]
+
+        live = conform(list(make_cached_stream(timespan).get_records(None)))
+        second = make_cached_stream(timespan)
+        cached = conform(list(second.get_records(None)))
+
+        second.client.query_workspace.assert_not_called()
+
+        assert cached == live
+        assert cached[0]["day"] == "2024-01-01T00:00:00.000000+00:00"
+
+    def test_recent_chunks_not_cached(
+        self, record_cache_dir: Path, make_cached_stream: MakeCachedStream
+    ) -> None:
+        """Test that chunks inside the ingestion window are always queried."""
+        end_time = datetime.now(timezone.utc)
+        stream = make_cached_stream((end_time - timedelta(hours=12), end_time))
+
+        list(stream.get_records(None))
+
+        stream.client.query_workspace.assert_called_once()
+        assert not list(record_cache_dir.iterdir())
+
+    @pytest.mark.parametrize(
+        "content", [b"not a gzip file", gzip.compress(b'{"id": 1')], ids=["garbage", "truncated"]
+    )
+    def test_unreadable_entry_queried_again(
+        self, record_cache_dir: Path, make_cached_stream: MakeCachedStream, content: bytes
+    ) -> None:
+        """Test that an unreadable cache entry is replaced by a live query."""
+        live_records = list(make_cached_stream((JAN1, JAN2)).get_records(None))
+        (cache_path,) = record_cache_dir.iterdir()
+        cache_path.write_bytes(content)
+
+        stream = make_cached_stream((JAN1, JAN2))
+        records = list(stream.get_records(None))
+
+        stream.client.query_workspace.assert_called_once()
+        assert records == live_records
+        assert len(gzip.decompress(cache_path.read_bytes()).splitlines()) == 1
+
+    def test_cache_dir_private(
+        self,
+        tmp_path: Path,
+        make_cached_stream: MakeCachedStream,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that the record cache directory is only accessible to its owner."""
+        cache_dir = tmp_path / "records"
+        monkeypatch.setattr(client, "RECORD_CACHE_DIR", cache_dir)
+
+        list(make_cached_stream((JAN1, JAN2)).get_records(None))
+
+        assert stat.S_IMODE(cache_dir.stat().st_mode) == stat.S_IRWXU
+
+    def test_failed_write_keeps_every_record(
+        self,
+        record_cache_dir: Path,
+        make_cached_stream: MakeCachedStream,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a failing cache write neither drops records nor leaves a cache file."""
+        stream = make_cached_stream((JAN1, JAN2))
+        files_during_write = []
+
+        def json_default(value: object) -> str:  # noqa: ARG001
+            files_during_write.extend(record_cache_dir.iterdir())
+            raise OSError(errno.ENOSPC, "No space left on device")
+
+        monkeypatch.setattr(client, "_json_default", json_default)
+        records = [{"id": 1}, {"id": 2, "day": JAN1}, {"id": 3}]
+
+        cached = list(stream._write_cached_records(record_cache_dir / "chunk.ndjson.gz", records))
+
+        assert cached == records
+        assert [path.suffix for path in files_during_write] == [".tmp"]
+        assert not list(record_cache_dir.iterdir())
@@ -0,0 +1,49 @@
+"""Tests for converting query result rows to records."""
+
+from __future__ import annotations
+
+import typing as t
+from unittest.mock import Mock
+
+from tap_azure_log_analytics.client import MAX_SPECIALIZED_COLUMNS
+
+if t.TYPE_CHECKING:
+    from tests.conftest import StreamFactory
+
+
+class TestRowConversion:
+    """Test specialized row converters."""
+
+    def test_records_match_column_names(self, make_stream: StreamFactory) -> None:
+        """Test that rows are converted to records keyed by column name."""
+        stream = make_stream()
+        table = Mock(columns=["id", "name"], rows=[[1, "a"], [2, "b"]])
+
+        records = list(stream._records_from_tables([table]))
+
+        assert records == [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+
+    def test_unusual_column_names(self, make_stream: StreamFactory) -> None:
+        """Test that column names are embedded safely in the generated converter."""
+        stream = make_stream()
+        columns = ["it's", 'say "hi"', "back\\slash", "line\nbreak", "{}"]
+        row = list(range(len(columns)))
+
+        converter = stream._row_converter(columns)
+
+        assert converter(row) == dict(zip(columns, row, strict=True))
+
+    def test_wide_tables(self, make_stream: StreamFactory) -> None:
+        """Test that tables wider than the specialization limit still convert correctly."""
+        stream = make_stream()
+        columns = [f"col{i}" for i in range(MAX_SPECIALIZED_COLUMNS + 1)]
+        row = list(range(len(columns)))
+
+        assert stream._row_converter(columns)(row) == dict(zip(columns, row, strict=True))
+
+    def test_converter_cached_per_layout(self, make_stream: StreamFactory) -> None:
+        """Test that converters are reused for the same column layout."""
+        stream = make_stream()
+
+        assert stream._row_converter(["a", "b"]) is stream._row_converter(("a", "b"))
+        assert stream._row_converter(["a", "b"]) is not stream._row_converter(["b", "a"])
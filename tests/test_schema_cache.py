@@ -0,0 +1,197 @@
+"""Tests for schema caching in Azure Log Analytics query streams."""
+
+from __future__ import annotations
+
+import typing as t
+from unittest.mock import Mock
+
+import pytest
+from azure.monitor.query import LogsQueryStatus
+
+from tap_azure_log_analytics import streams
+from tap_azure_log_analytics.streams import LogAnalyticsQueryStream
+from tap_azure_log_analytics.tap import TapAzureLogAnalytics
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+    from tests.conftest import StreamFactory
+
+SCHEMA = {"type": "object", "properties": {"id": {"type": ["integer", "null"]}}}
+
+
+@pytest.fixture
+def schema_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the on-disk schema cache at a temporary directory."""
+    monkeypatch.setattr(streams, "SCHEMA_CACHE_DIR", tmp_path)
+    return tmp_path
+
+
+class TestDiskSchemaCache:
+    """Test the on-disk schema cache."""
+
+    def test_schema_written_and_reused(
+        self,
+        schema_cache_dir: Path,
+        make_stream: StreamFactory,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a generated schema is persisted and reused by later streams."""
+        config = {"schema_cache_ttl_days": 1}
+
+        first = make_stream(config)
+        monkeypatch.setattr(first, "_query_schema", Mock(return_value=SCHEMA))
+        assert first.generate_schema() == SCHEMA
+        assert len(list(schema_cache_dir.iterdir())) == 1
+
+        second = make_stream(config)
+        query_schema = Mock()
+        monkeypatch.setattr(second, "_query_schema", query_schema)
+        assert second.generate_schema() == SCHEMA
+        query_schema.assert_not_called()
+
+    def test_cache_disabled_without_ttl(
+        self,
+        schema_cache_dir: Path,
+        make_stream: StreamFactory,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that nothing is cached when schema_cache_ttl_days is unset."""
+        stream = make_stream()
+        monkeypatch.setattr(stream, "_query_schema", Mock(return_value=SCHEMA))
+
+        assert stream.generate_schema() == SCHEMA
+        assert not list(schema_cache_dir.iterdir())
+
+    def test_empty_schema_not_cached(
+        self,
+        schema_cache_dir: Path,
+        make_stream: StreamFactory,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that empty schemas from failed sample queries are not cached."""
+        stream = make_stream({"schema_cache_ttl_days": 1})
+        empty_schema = {"type": "object", "properties": {}}
+        monkeypatch.setattr(stream, "_query_schema", Mock(return_value=empty_schema))
+
+        assert stream.generate_schema() == empty_schema
+        assert not list(schema_cache_dir.iterdir())
+
+
+class TestRunSchemaCache:
+    """Test reuse of schemas between streams within a single run."""
+
+    def test_same_query_queried_once(
+        self, mock_tap: Mock, make_stream: StreamFactory, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that streams of a tap sharing a query reuse the generated schema."""
+        query_schema = Mock(return_value=SCHEMA)
+        monkeypatch.setattr(LogAnalyticsQueryStream, "_query_schema", query_schema)
+
+        first = make_stream(tap=mock_tap).generate_schema()
+        second = make_stream(tap=mock_tap).generate_schema()
+
+        assert first == second == SCHEMA
+        assert first is not second
+        query_schema.assert_called_once()
+
+    def test_cache_not_shared_between_taps(
+        self, make_stream: StreamFactory, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a new tap instance starts with an empty schema cache."""
+        query_schema = Mock(return_value=SCHEMA)
+        monkeypatch.setattr(LogAnalyticsQueryStream, "_query_schema", query_schema)
+
+        make_stream().generate_schema()
+        make_stream().generate_schema()
+
+        assert query_schema.call_count == 2
+
+
+class TestExplicitSchema:
+    """Test schemas provided directly in the query configuration."""
+
+    def test_explicit_schema_skips_sample_query(
+        self, make_stream: StreamFactory, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a configured schema is used without querying the workspace."""
+        query_schema = Mock()
+        monkeypatch.setattr(LogAnalyticsQueryStream, "_query_schema", query_schema)
+
+        stream = make_stream(query_config={"schema": SCHEMA})
+
+        assert stream.schema == SCHEMA
+        query_schema.assert_not_called()
+
+
+QUERIES = [
+    {"name": "a", "query": "A"},
+    {"name": "b", "query": "B"},
+    {"name": "c", "query": "A"},
+]
+
+
+@pytest.fixture
+def batch_client(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Replace the shared client of every tap with a mock."""
+    client = Mock()
+    monkeypatch.setattr(TapAzureLogAnalytics, "shared_client", client)
+    return client
+
+
+def batch_responses(table: Mock, count: int) -> list[Mock]:
+    """Build successful batch responses that all contain ``table``."""
+    return [Mock(status=LogsQueryStatus.SUCCESS, tables=[table]) for _ in range(count)]
+
+
+class TestBatchedSchemaQueries:
+    """Test batching of sample queries across streams."""
+
+    def test_prefetch_sends_one_batch(self, batch_client: Mock) -> None:
+        """Test that distinct queries are sent in a single batch and seed the cache."""
+        table = Mock(columns=["id"], columns_types=["int"], rows=[])
+        batch_client.query_batch.return_value = batch_responses(table, 2)
+
+        tap = TapAzureLogAnalytics(config={"workspace_id": "test-workspace", "queries": QUERIES})
+
+        batch_client.query_batch.assert_called_once()
+        batch = batch_client.query_batch.call_args.args[0]
+        assert [query.body["query"] for query in batch] == ["A", "B"]
+        for stream in tap.streams.values():
+            assert "id" in stream.schema["properties"]
+        batch_client.query_workspace.assert_not_called()
+
+    def test_empty_batched_schema_kept(self, batch_client: Mock) -> None:
+        """Test that an empty batched result isn't queried again individually."""
+        table = Mock(columns=[], columns_types=[], rows=[])
+        batch_client.query_batch.return_value = batch_responses(table, 2)
+
+        tap = TapAzureLogAnalytics(config={"workspace_id": "test-workspace", "queries": QUERIES})
+
+        for stream in tap.streams.values():
+            assert stream.schema["properties"] == {}
+        batch_client.query_workspace.assert_not_called()
+
+    def test_no_prefetch_with_input_catalog(self, batch_client: Mock) -> None:
+        """Test that syncs with a catalog only query schemas for the streams they read."""
+        catalog = {
+            "streams": [
+                {
+                    "tap_stream_id": query["name"],
+                    "stream": query["name"],
+                    "schema": SCHEMA,
+                    "metadata": [
+                        {"breadcrumb": [], "metadata": {"selected": query["name"] == "a"}}
+                    ],
+                }
+                for query in QUERIES
+            ]
+        }
+
+        tap = TapAzureLogAnalytics(
+            config={"workspace_id": "test-workspace", "queries": QUERIES}, catalog=catalog
+        )
+
+        assert len(tap.streams) == len(QUERIES)
+        batch_client.query_batch.assert_not_called()
+        batch_client.query_workspace.assert_not_called()
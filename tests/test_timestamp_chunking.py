@@ -1,332 +1,226 @@
 """Tests for timestamp chunking functionality in Azure Log Analytics tap."""
 
-from datetime import datetime, timedelta, timezone
-from unittest.mock import Mock, patch
+from __future__ import annotations
 
+import threading
+import time
+from datetime import datetime, timedelta, timezone, tzinfo
+from unittest.mock import Mock
+
+import pytest
+from azure.monitor.query import LogsQueryStatus
+
+from tap_azure_log_analytics import client
 from tap_azure_log_analytics.client import AzureLogAnalyticsStream
 from tap_azure_log_analytics.streams import LogAnalyticsQueryStream
 
+UTC = timezone.utc
+JAN1, JAN2, JAN3, JAN5, JAN6, JAN8 = (
+    datetime(2024, 1, day, tzinfo=UTC) for day in (1, 2, 3, 5, 6, 8)
+)
 
-class TestTimestampChunking:
-    """Test timestamp chunking functionality."""
+FROZEN_NOW = datetime(2024, 6, 1, 12, 0, tzinfo=UTC)
+# _calculate_timespan ends the timespan 5 minutes before now
+FROZEN_END = datetime(2024, 6, 1, 11, 55, tzinfo=UTC)
 
-    def test_chunk_timespan_basic(self) -> None:
-        """Test basic timespan chunking functionality."""
-        mock_tap = Mock()
-        mock_tap.config = {}
-        stream = AzureLogAnalyticsStream(mock_tap, name="test_stream")
 
-        # Test with 5 days total, 2 days per chunk
-        start_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        end_time = datetime(2024, 1, 6, tzinfo=timezone.utc)
+class FrozenDatetime(datetime):
+    """datetime whose now() always returns FROZEN_NOW."""
 
-        chunks = stream._chunk_timespan(start_time, end_time, chunk_days=2)
+    @classmethod
+    def now(cls, tz: tzinfo | None = None) -> datetime:
+        """Return the frozen time converted to tz."""
+        return FROZEN_NOW.astimezone(tz)
 
-        # Should create 3 chunks: Jan 1-3, Jan 3-5, Jan 5-6
-        assert len(chunks) == 3
-        assert chunks[0] == (
-            datetime(2024, 1, 1, tzinfo=timezone.utc),
-            datetime(2024, 1, 3, tzinfo=timezone.utc),
-        )
-        assert chunks[1] == (
-            datetime(2024, 1, 3, tzinfo=timezone.utc),
-            datetime(2024, 1, 5, tzinfo=timezone.utc),
-        )
-        assert chunks[2] == (
-            datetime(2024, 1, 5, tzinfo=timezone.utc),
-            datetime(2024, 1, 6, tzinfo=timezone.utc),
-        )
 
-    def test_chunk_timespan_exact_multiple(self) -> None:
-        """Test chunking when timespan is exact multiple of chunk size."""
-        mock_tap = Mock()
-        mock_tap.config = {}
-        stream = AzureLogAnalyticsStream(mock_tap, name="test_stream")
+@pytest.fixture
+def frozen_now(monkeypatch: pytest.MonkeyPatch) -> datetime:
+    """Freeze the clock used by the stream client."""
+    monkeypatch.setattr(client, "datetime", FrozenDatetime)
+    return FROZEN_NOW
 
-        start_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        end_time = datetime(2024, 1, 5, tzinfo=timezone.utc)  # 4 days
 
-        chunks = stream._chunk_timespan(start_time, end_time, chunk_days=2)
+@pytest.fixture(scope="module")
+def stream() -> AzureLogAnalyticsStream:
+    """Stream shared by tests that don't need any tap config."""
+    mock_tap = Mock()
+    mock_tap.config = {}
+    return AzureLogAnalyticsStream(mock_tap, name="test_stream")
 
-        # Should create 2 chunks: Jan 1-3, Jan 3-5
-        assert len(chunks) == 2
-        assert chunks[0] == (
-            datetime(2024, 1, 1, tzinfo=timezone.utc),
-            datetime(2024, 1, 3, tzinfo=timezone.utc),
-        )
-        assert chunks[1] == (
-            datetime(2024, 1, 3, tzinfo=timezone.utc),
-            datetime(2024, 1, 5, tzinfo=timezone.utc),
-        )
 
-    def test_chunk_timespan_single_chunk(self) -> None:
-        """Test chunking when timespan fits in single chunk."""
-        mock_tap = Mock()
-        mock_tap.config = {}
-        stream = AzureLogAnalyticsStream(mock_tap, name="test_stream")
+@pytest.fixture(scope="module")
+def stream_with_start_date() -> AzureLogAnalyticsStream:
+    """Stream shared by tests that need a start_date in the tap config."""
+    mock_tap = Mock()
+    mock_tap.config = {"start_date": "2024-01-01T00:00:00Z"}
+    return AzureLogAnalyticsStream(mock_tap, name="test_stream")
 
-        start_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        end_time = datetime(2024, 1, 2, tzinfo=timezone.utc)  # 1 day
 
-        chunks = stream._chunk_timespan(start_time, end_time, chunk_days=2)
+@pytest.fixture(scope="module")
+def query_stream() -> LogAnalyticsQueryStream:
+    """Query stream shared by tests; tests adjust query_config via monkeypatch."""
+    mock_tap = Mock()
+    mock_tap.config = {"workspace_id": "test-workspace"}
 
-        # Should create 1 chunk
-        assert len(chunks) == 1
-        assert chunks[0] == (
-            datetime(2024, 1, 1, tzinfo=timezone.utc),
-            datetime(2024, 1, 2, tzinfo=timezone.utc),
-        )
+    query_config = {
+        "name": "test_stream",
+        "query": "test query",
+        "primary_keys": ["id"],
+        "replication_key": None,
+        "timespan_days": 7,
+        "chunk_size_days": 2,
+    }
 
-    def test_calculate_timespan_with_replication_key(self) -> None:
-        """Test timespan calculation when replication key is present."""
-        # Mock tap and stream
-        mock_tap = Mock()
-        mock_tap.config = {"start_date": "2024-01-01T00:00:00Z"}
+    return LogAnalyticsQueryStream(mock_tap, query_config)
 
-        stream = AzureLogAnalyticsStream(mock_tap, name="test_stream")
-        stream.replication_key = "TimeGenerated"
+
+class TestTimestampChunking:
+    """Test timestamp chunking functionality."""
+
+    @pytest.mark.parametrize(
+        ("start_time", "end_time", "chunk_days", "expected"),
+        [
+            pytest.param(JAN1, JAN6, 2, [(JAN1, JAN3), (JAN3, JAN5), (JAN5, JAN6)], id="basic"),
+            pytest.param(JAN1, JAN5, 2, [(JAN1, JAN3), (JAN3, JAN5)], id="exact_multiple"),
+            pytest.param(JAN1, JAN2, 2, [(JAN1, JAN2)], id="single_chunk"),
+            # Invalid chunk sizes fall back to a single chunk instead of looping forever
+            pytest.param(JAN1, JAN2, 0, [(JAN1, JAN2)], id="zero_days"),
+            pytest.param(JAN1, JAN2, -1, [(JAN1, JAN2)], id="negative_days"),
+            pytest.param(JAN1, JAN1, 1, [], id="same_start_end"),
+            pytest.param(JAN2, JAN1, 1, [], id="start_after_end"),
+        ],
+    )
+    def test_chunk_timespan(
+        self,
+        stream: AzureLogAnalyticsStream,
+        start_time: datetime,
+        end_time: datetime,
+        chunk_days: int,
+        expected: list[tuple[datetime, datetime]],
+    ) -> None:
+        """Test splitting a timespan into chunks, including edge cases."""
+        assert stream._chunk_timespan(start_time, end_time, chunk_days=chunk_days) == expected
+
+    @pytest.mark.usefixtures("frozen_now")
+    def test_calculate_timespan_with_replication_key(
+        self, stream_with_start_date: AzureLogAnalyticsStream, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test timespan calculation when replication key is present."""
+        stream = stream_with_start_date
+        monkeypatch.setattr(stream, "replication_key", "TimeGenerated")
 
         # Mock get_starting_timestamp to return a specific time
-        with patch.object(
-            stream, "get_starting_timestamp", return_value=datetime(2024, 1, 2, tzinfo=timezone.utc)
-        ):
-            start_time, end_time = stream._calculate_timespan(None)
-
-            assert start_time == datetime(2024, 1, 2, tzinfo=timezone.utc)
-            # End time should be 5 minutes in the past
-            expected_end = datetime.now(timezone.utc) - timedelta(minutes=5)
-            assert abs((end_time - expected_end).total_seconds()) < 1  # Within 1 second
-            assert end_time.tzinfo is not None  # Should be timezone aware
-
-    def test_calculate_timespan_without_replication_key_uses_start_date(self) -> None:
-        """Test timespan calculation without replication key uses start_date from config."""
-        mock_tap = Mock()
-        mock_tap.config = {"start_date": "2024-01-01T00:00:00Z"}
+        monkeypatch.setattr(stream, "get_starting_timestamp", Mock(return_value=JAN2))
+
+        start_time, end_time = stream._calculate_timespan(None)
 
-        stream = AzureLogAnalyticsStream(mock_tap, name="test_stream")
-        stream.replication_key = None
+        assert start_time == JAN2
+        # End time should be 5 minutes in the past
+        assert end_time == FROZEN_END
+
+    @pytest.mark.usefixtures("frozen_now")
+    def test_calculate_timespan_without_replication_key_uses_start_date(
+        self, stream_with_start_date: AzureLogAnalyticsStream, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test timespan calculation without replication key uses start_date from config."""
+        stream = stream_with_start_date
+        monkeypatch.setattr(stream, "replication_key", None)
 
         start_time, end_time = stream._calculate_timespan(None)
 
-        assert start_time == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert start_time == JAN1
         # End time should be 5 minutes in the past
-        expected_end = datetime.now(timezone.utc) - timedelta(minutes=5)
-        assert abs((end_time - expected_end).total_seconds()) < 1  # Within 1 second
-        assert end_time.tzinfo is not None
+        assert end_time == FROZEN_END
 
-    def test_calculate_timespan_without_replication_key_no_start_date(self) -> None:
+    @pytest.mark.usefixtures("frozen_now")
+    def test_calculate_timespan_without_replication_key_no_start_date(
+        self, stream: AzureLogAnalyticsStream, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test timespan calculation without replication key and no start_date defaults to 1 day ago."""
-        mock_tap = Mock()
-        mock_tap.config = {}
-
-        stream = AzureLogAnalyticsStream(mock_tap, name="test_stream")
-        stream.replication_key = None
+        monkeypatch.setattr(stream, "replication_key", None)
 
         start_time, end_time = stream._calculate_timespan(None)
 
-        # Should default to 1 day ago from end time (which is 5 minutes in the future)
-        expected_start = end_time - timedelta(days=1)
-        assert abs((start_time - expected_start).total_seconds()) < 1  # Within 1 second
+        # Should default to 1 day before the end time
+        assert start_time == FROZEN_END - timedelta(days=1)
         # End time should be 5 minutes in the past
-        expected_end = datetime.now(timezone.utc) - timedelta(minutes=5)
-        assert abs((end_time - expected_end).total_seconds()) < 1  # Within 1 second
-        assert end_time.tzinfo is not None
+        assert end_time == FROZEN_END
 
-    def test_calculate_timespan_string_start_date(self) -> None:
+    @pytest.mark.usefixtures("frozen_now")
+    def test_calculate_timespan_string_start_date(
+        self, stream_with_start_date: AzureLogAnalyticsStream, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test timespan calculation with string start_date."""
-        mock_tap = Mock()
-        mock_tap.config = {"start_date": "2024-01-01T00:00:00Z"}
-
-        stream = AzureLogAnalyticsStream(mock_tap, name="test_stream")
-        stream.replication_key = None
+        stream = stream_with_start_date
+        monkeypatch.setattr(stream, "replication_key", None)
 
         start_time, end_time = stream._calculate_timespan(None)
 
-        assert start_time == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert start_time == JAN1
         # End time should be 5 minutes in the past
-        expected_end = datetime.now(timezone.utc) - timedelta(minutes=5)
-        assert abs((end_time - expected_end).total_seconds()) < 1  # Within 1 second
-        assert end_time.tzinfo is not None
+        assert end_time == FROZEN_END
 
-    def test_calculate_timespan_naive_datetime(self) -> None:
+    @pytest.mark.usefixtures("frozen_now")
+    def test_calculate_timespan_naive_datetime(
+        self, stream: AzureLogAnalyticsStream, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test timespan calculation with naive datetime gets timezone."""
-        mock_tap = Mock()
-        mock_tap.config = {"start_date": datetime(2024, 1, 1)}  # Naive datetime
-
-        stream = AzureLogAnalyticsStream(mock_tap, name="test_stream")
-        stream.replication_key = None
+        monkeypatch.setitem(stream._config, "start_date", datetime(2024, 1, 1))  # Naive datetime
+        monkeypatch.setattr(stream, "replication_key", None)
 
         start_time, end_time = stream._calculate_timespan(None)
 
-        assert start_time.tzinfo == timezone.utc
+        assert start_time.tzinfo == UTC
         # End time should be 5 minutes in the past
-        expected_end = datetime.now(timezone.utc) - timedelta(minutes=5)
-        assert abs((end_time - expected_end).total_seconds()) < 1  # Within 1 second
-        assert end_time.tzinfo is not None
+        assert end_time == FROZEN_END
 
 
 class TestLogAnalyticsQueryStreamChunking:
     """Test chunking functionality in LogAnalyticsQueryStream."""
 
-    def test_query_stream_with_timespan_days(self) -> None:
-        """Test that query stream properly uses timespan_days when no replication key."""
-        mock_tap = Mock()
-        mock_tap.config = {"workspace_id": "test-workspace"}
-
-        query_config = {
-            "name": "test_stream",
-            "query": "test query",
-            "primary_keys": ["id"],
-            "replication_key": None,
-            "timespan_days": 7,
-            "chunk_size_days": 2,
-        }
-
-        stream = LogAnalyticsQueryStream(mock_tap, query_config)
-
-        # Mock the client to avoid actual API calls
-        with patch.object(stream, "client") as mock_client:
-            mock_response = Mock()
-            mock_response.status = Mock()
-            mock_response.tables = []
-            mock_client.query_workspace.return_value = mock_response
-
-            # Mock _calculate_timespan to test the logic
-            with patch.object(stream, "_calculate_timespan") as mock_calc:
-                mock_calc.return_value = (
-                    datetime(2024, 1, 1, tzinfo=timezone.utc),
-                    datetime(2024, 1, 8, tzinfo=timezone.utc),
-                )
-
-                # This should call _chunk_timespan with chunk_size_days=2
-                list(stream.get_records(None))
-
-                # Verify that chunking was called with the right parameters
-                # The actual test would be in the _calculate_timespan method
-                # but we need to fix that method first
-
-    def test_query_stream_chunk_size_parameter_mismatch(self) -> None:
+    def test_query_stream_chunk_size_parameter_mismatch(
+        self, query_stream: LogAnalyticsQueryStream, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that the chunk_size_days parameter is properly passed to _chunk_timespan."""
-        mock_tap = Mock()
-        mock_tap.config = {"workspace_id": "test-workspace"}
-
-        query_config = {
-            "name": "test_stream",
-            "query": "test query",
-            "primary_keys": ["id"],
-            "replication_key": None,
-            "timespan_days": 5,
-            "chunk_size_days": 1,
-        }
-
-        stream = LogAnalyticsQueryStream(mock_tap, query_config)
+        stream = query_stream
+        monkeypatch.setitem(stream.query_config, "timespan_days", 5)
+        monkeypatch.setitem(stream.query_config, "chunk_size_days", 1)
 
         # Mock the client
-        with patch.object(stream, "client") as mock_client:
-            mock_response = Mock()
-            mock_response.status = Mock()
-            mock_response.tables = []
-            mock_client.query_workspace.return_value = mock_response
-
-            # Mock _calculate_timespan to return a known timespan
-            with patch.object(stream, "_calculate_timespan") as mock_calc:
-                start_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
-                end_time = datetime(2024, 1, 6, tzinfo=timezone.utc)
-                mock_calc.return_value = (start_time, end_time)
+        mock_client = Mock()
+        mock_client.query_workspace.return_value = Mock(status=Mock(), tables=[])
+        monkeypatch.setattr(stream, "client", mock_client)
+
+        # Mock _calculate_timespan to return a known timespan
+        start_time = JAN1
+        end_time = JAN6
+        monkeypatch.setattr(
+            stream, "_calculate_timespan", Mock(return_value=(start_time, end_time))
+        )
 
-                # Mock _chunk_timespan to verify it's called with correct parameters
-                with patch.object(stream, "_chunk_timespan") as mock_chunk:
-                    mock_chunk.return_value = [(start_time, end_time)]
+        # Mock _chunk_timespan to verify it's called with correct parameters
+        mock_chunk = Mock(return_value=[(start_time, end_time)])
+        monkeypatch.setattr(stream, "_chunk_timespan", mock_chunk)
 
-                    list(stream.get_records(None))
+        list(stream.get_records(None))
 
-                    # Verify _chunk_timespan was called with chunk_size_days=1
-                    mock_chunk.assert_called_once_with(start_time, end_time, 1)
+        # Verify _chunk_timespan was called with chunk_size_days=1
+        mock_chunk.assert_called_once_with(start_time, end_time, 1)
 
-    def test_query_stream_with_replication_key_ignores_timespan_days(self) -> None:
+    def test_query_stream_with_replication_key_ignores_timespan_days(
+        self, query_stream: LogAnalyticsQueryStream, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that when replication key exists, timespan_days is ignored."""
-        mock_tap = Mock()
-        mock_tap.config = {"workspace_id": "test-workspace"}
-
-        query_config = {
-            "name": "test_stream",
-            "query": "test query",
-            "primary_keys": ["id"],
-            "replication_key": "TimeGenerated",
-            "timespan_days": 7,  # This should be ignored
-            "chunk_size_days": 2,
-        }
-
-        stream = LogAnalyticsQueryStream(mock_tap, query_config)
+        stream = query_stream
+        monkeypatch.setattr(stream, "replication_key", "TimeGenerated")
 
         # Mock get_starting_timestamp to return a specific time
-        with patch.object(
-            stream, "get_starting_timestamp", return_value=datetime(2024, 1, 2, tzinfo=timezone.utc)
-        ):
-            start_time, _end_time = stream._calculate_timespan(None)
-
-            # Should use replication key timestamp, not timespan_days
-            assert start_time == datetime(2024, 1, 2, tzinfo=timezone.utc)
-
-
-class TestTimestampChunkingEdgeCases:
-    """Test edge cases for timestamp chunking."""
-
-    def test_chunk_timespan_zero_days(self) -> None:
-        """Test chunking with zero days (should not create infinite loop)."""
-        mock_tap = Mock()
-        mock_tap.config = {}
-        stream = AzureLogAnalyticsStream(mock_tap, name="test_stream")
-
-        start_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        end_time = datetime(2024, 1, 2, tzinfo=timezone.utc)
-
-        chunks = stream._chunk_timespan(start_time, end_time, chunk_days=0)
+        monkeypatch.setattr(stream, "get_starting_timestamp", Mock(return_value=JAN2))
 
-        # Should handle gracefully - might return single chunk or empty list
-        assert isinstance(chunks, list)
-
-    def test_chunk_timespan_negative_days(self) -> None:
-        """Test chunking with negative days."""
-        mock_tap = Mock()
-        mock_tap.config = {}
-        stream = AzureLogAnalyticsStream(mock_tap, name="test_stream")
-
-        start_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        end_time = datetime(2024, 1, 2, tzinfo=timezone.utc)
-
-        chunks = stream._chunk_timespan(start_time, end_time, chunk_days=-1)
-
-        # Should handle gracefully
-        assert isinstance(chunks, list)
-
-    def test_chunk_timespan_same_start_end(self) -> None:
-        """Test chunking when start and end times are the same."""
-        mock_tap = Mock()
-        mock_tap.config = {}
-        stream = AzureLogAnalyticsStream(mock_tap, name="test_stream")
-
-        start_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        end_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
-
-        chunks = stream._chunk_timespan(start_time, end_time, chunk_days=1)
-
-        # Should return empty list since start >= end
-        assert len(chunks) == 0
-
-    def test_chunk_timespan_start_after_end(self) -> None:
-        """Test chunking when start time is after end time."""
-        mock_tap = Mock()
-        mock_tap.config = {}
-        stream = AzureLogAnalyticsStream(mock_tap, name="test_stream")
-
-        start_time = datetime(2024, 1, 2, tzinfo=timezone.utc)
-        end_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
-
-        chunks = stream._chunk_timespan(start_time, end_time, chunk_days=1)
+        start_time, _end_time = stream._calculate_timespan(None)
 
-        # Should return empty list since start > end
-        assert len(chunks) == 0
+        # Should use replication key timestamp, not timespan_days
+        assert start_time == JAN2
 
 
 class TestTimespanDaysIntegration:
@@ -356,9 +250,10 @@ class TestTimespanDaysIntegration:
         start_time, _end_time = stream._calculate_timespan(None)
 
         # Expected: start_time should be the start_date, not calculated from timespan_days
-        expected_start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        expected_start = JAN1
         assert start_time == expected_start
 
+    @pytest.mark.usefixtures("frozen_now")
     def test_timespan_days_used_when_no_start_date(self) -> None:
         """Test that timespan_days is used when no start_date is specified."""
         mock_tap = Mock()
@@ -380,6 +275,88 @@ class TestTimespanDaysIntegration:
 
         start_time, end_time = stream._calculate_timespan(None)
 
-        # Expected: start_time should be 7 days ago from end_time
-        expected_start = end_time - timedelta(days=7)
-        assert abs((start_time - expected_start).total_seconds()) < 1
+        # Expected: start_time should be 7 days before the end time
+        assert end_time == FROZEN_END
+        assert start_time == FROZEN_END - timedelta(days=7)
+
+
+class TestChunkPrefetch:
+    """Test that chunk queries are prefetched and yielded in order."""
+
+    def test_records_yielded_in_chunk_order(
+        self, query_stream: LogAnalyticsQueryStream, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that records from every chunk are yielded in chunk order."""
+        stream = query_stream
+        monkeypatch.setitem(stream.query_config, "chunk_size_days", 1)
+
+        def query_workspace(
+            workspace_id: str,  # noqa: ARG001
+            query: str,  # noqa: ARG001
+            timespan: tuple[datetime, datetime],
+        ) -> Mock:
+            table = Mock(columns=["day"], rows=[[timespan[0].day]])
+            return Mock(status=LogsQueryStatus.SUCCESS, tables=[table])
+
+        monkeypatch.setattr(
+            stream, "client", Mock(query_workspace=Mock(side_effect=query_workspace))
+        )
+        monkeypatch.setattr(stream, "_calculate_timespan", Mock(return_value=(JAN1, JAN5)))
+
+        records = list(stream.get_records(None))
+
+        assert records == [{"day": 1}, {"day": 2}, {"day": 3}, {"day": 4}]
+
+    def test_concurrent_chunks_yielded_in_order(
+        self, query_stream: LogAnalyticsQueryStream, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that chunks finishing out of order are still yielded in chunk order."""
+        stream = query_stream
+        monkeypatch.setitem(stream.query_config, "chunk_size_days", 1)
+        monkeypatch.setitem(stream._config, "max_concurrent_chunks", 3)
+
+        def query_workspace(
+            workspace_id: str,  # noqa: ARG001
+            query: str,  # noqa: ARG001
+            timespan: tuple[datetime, datetime],
+        ) -> Mock:
+            # Earlier chunks take longer, so later chunks complete first
+            time.sleep((10 - timespan[0].day) / 200)
+            table = Mock(columns=["day"], rows=[[timespan[0].day]])
+            return Mock(status=LogsQueryStatus.SUCCESS, tables=[table])
+
+        monkeypatch.setattr(
+            stream, "client", Mock(query_workspace=Mock(side_effect=query_workspace))
+        )
+        monkeypatch.setattr(stream, "_calculate_timespan", Mock(return_value=(JAN1, JAN8)))
+
+        records = list(stream.get_records(None))
+
+        assert records == [{"day": day} for day in range(1, 8)]
+
+    def test_client_resolved_before_querying_chunks(
+        self, query_stream: LogAnalyticsQueryStream, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the shared client is looked up once, on the calling thread."""
+        stream = query_stream
+        monkeypatch.setitem(stream.query_config, "chunk_size_days", 1)
+        monkeypatch.setitem(stream._config, "max_concurrent_chunks", 3)
+        lookup_threads: list[threading.Thread] = []
+
+        def shared_client(tap: Mock) -> Mock:  # noqa: ARG001
+            lookup_threads.append(threading.current_thread())
+            table = Mock(columns=["id"], rows=[[1]])
+            response = Mock(status=LogsQueryStatus.SUCCESS, tables=[table])
+            return Mock(query_workspace=Mock(return_value=response))
+
+        # Drop any client cached by earlier tests so it is looked up on the tap again
+        monkeypatch.delitem(stream.__dict__, "client", raising=False)
+        monkeypatch.setattr(
+            type(stream._tap), "shared_client", property(shared_client), raising=False
+        )
+        monkeypatch.setattr(stream, "_calculate_timespan", Mock(return_value=(JAN1, JAN8)))
+
+        records = list(stream.get_records(None))
+
+        assert records == [{"id": 1}] * 7
+        assert lookup_threads == [threading.current_thread()]